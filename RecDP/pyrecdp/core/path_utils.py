@@ -1,23 +1,26 @@
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Iterator, Optional, List, Union
 
 
-def get_files(
+def iter_files(
         input_dir: Union[str, Path],
         glob: str = "**/[!.]*",
         exclude: Optional[List] = None,
         exclude_hidden: bool = True,
         recursive: bool = False,
         required_exts: Optional[List[str]] = None
-) -> set[Path]:
-    """ get files from a directory"""
+) -> Iterator[Path]:
+    """lazily yield files from a directory in discovery order.
+
+    Unlike get_files this never materializes the whole listing, so callers
+    can start consuming files while large trees are still being walked.
+    """
     if input_dir is None:
         raise ValueError("input_dir is required!")
 
     if isinstance(input_dir, str):
         input_dir = Path(input_dir)
 
-    all_files = set()
     rejected_files = set()
 
     if exclude is not None:
@@ -31,7 +34,7 @@ def get_files(
                 for file in input_dir.glob(excluded_pattern):
                     rejected_files.add(Path(file))
 
-    file_refs = list(input_dir.rglob(glob) if recursive else input_dir.glob(glob))
+    file_refs = input_dir.rglob(glob) if recursive else input_dir.glob(glob)
 
     for ref in file_refs:
         # Manually check if file is hidden or directory instead of
@@ -50,7 +53,23 @@ def get_files(
         ):
             continue
         else:
-            ref.absolute().as_posix()
-            all_files.add(ref)
+            yield ref
 
-    return all_files
+
+def get_files(
+        input_dir: Union[str, Path],
+        glob: str = "**/[!.]*",
+        exclude: Optional[List] = None,
+        exclude_hidden: bool = True,
+        recursive: bool = False,
+        required_exts: Optional[List[str]] = None
+) -> set[Path]:
+    """ get files from a directory"""
+    return set(iter_files(
+        input_dir,
+        glob=glob,
+        exclude=exclude,
+        exclude_hidden=exclude_hidden,
+        recursive=recursive,
+        required_exts=required_exts,
+    ))
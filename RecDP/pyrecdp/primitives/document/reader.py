@@ -14,18 +14,97 @@
  limitations under the License.
  """
 
+import functools
+import hashlib
+import importlib.util
 import os
+import pickle
 import re
+import shutil
+import tempfile
+import threading
+import time
 from abc import abstractmethod, ABC
 from pathlib import Path
 from typing import List, Dict, Type, Optional, Callable, Any, Union, Sequence
 
 from loguru import logger
 
-from pyrecdp.core.import_utils import check_availability_and_install
+from pyrecdp.core.import_utils import check_availability_and_install, fix_package_name
 from pyrecdp.primitives.document.schema import Document
 
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# first alphabetic character of a text; [^\W\d_] is the unicode-aware letter
+# class, matching what str.isalpha accepted in the old per-character scan
+_FIRST_ALPHA = re.compile(r'[^\W\d_]')
+
+
+# fingerprints computed earlier in this run, keyed by resolved path plus stat
+# identity so a modified file re-hashes; without this every input was read and
+# hashed twice, once by the dedupe pass and once by the parse cache
+_fingerprint_cache: Dict[tuple, str] = {}
+_fingerprint_lock = threading.Lock()
+
+
+def _sha256_file(file: Path) -> str:
+    """content fingerprint of a file, hashed incrementally in 1 MiB chunks."""
+    stat = os.stat(file)
+    key = (os.path.realpath(str(file)), stat.st_mtime_ns, stat.st_size)
+    with _fingerprint_lock:
+        fingerprint = _fingerprint_cache.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    h = hashlib.sha256()
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    fingerprint = h.hexdigest()
+    with _fingerprint_lock:
+        _fingerprint_cache[key] = fingerprint
+    return fingerprint
+
+
+# system package -> binary to probe on PATH before shelling out to apt-get
+_binary_for_pkg = {
+    'tesseract-ocr': 'tesseract',
+}
+
+
+# memoized imports of the heavy optional dependencies: whisper and langchain
+# pay noticeable import-time side effects, so hot paths fetch them through
+# these cached helpers instead of re-running the import machinery per call
+
+@functools.cache
+def _whisper():
+    import whisper
+    return whisper
+
+
+@functools.cache
+def _recursive_url_loader():
+    from langchain.document_loaders import RecursiveUrlLoader
+    return RecursiveUrlLoader
+
+
+@functools.cache
+def _langchain_base_loader():
+    from langchain.document_loaders.base import BaseLoader
+    return BaseLoader
+
+
+@functools.cache
+def _youtube_audio_loader():
+    from langchain.document_loaders.blob_loaders.youtube_audio import YoutubeAudioLoader
+    return YoutubeAudioLoader
+
+
+def _document_cache_dir() -> Path:
+    return Path(os.getenv('PYRECDP_CACHE_DIR', str(Path.home() / '.cache' / 'pyrecdp')))
+
+
 class DocumentReader(ABC):
     """interface for document loader"""
 
@@ -37,6 +116,18 @@ class DocumentReader(ABC):
 class FileBaseReader(DocumentReader, ABC):
     """interface for loading document from a file."""
 
+    # readers doing pure-python parsing are GIL-bound and benefit from worker
+    # processes instead of threads in read_from_directory
+    cpu_bound: bool = False
+
+    # readers that already drop empty documents in load_file can skip the
+    # redundant filter pass in load
+    pre_filtered: bool = False
+
+    # set per reader class once its requirements are installed, so repeated
+    # setup calls in the same process are no-ops
+    _setup_done: bool = False
+
     def __init__(self, file: Path, single_text_per_document: bool = True, page_separator: str = '\n'):
         self.single_text_per_document = single_text_per_document
         self.page_separator = page_separator or '\n'
@@ -44,36 +135,95 @@ class FileBaseReader(DocumentReader, ABC):
 
     @classmethod
     def setup(cls):
+        if cls._setup_done:
+            return
         for pkg in cls.system_requirements:
+            # an apt-get invocation costs hundreds of ms even when there is
+            # nothing to do, so skip it when the binary is already on PATH
+            if shutil.which(_binary_for_pkg.get(pkg, pkg)):
+                continue
             os.system(f'apt-get install -y {pkg}')
         for pkg in cls.requirements:
+            if importlib.util.find_spec(fix_package_name(pkg)) is not None:
+                continue
             check_availability_and_install(pkg, verbose=1)
+        cls._setup_done = True
 
     def get_metadata(self):
         return {"source": str(self.file)}
 
+    def _parse_settings(self) -> dict:
+        """reader settings that change load_file output.
+
+        Folded into the parse-cache key, so readers built with different
+        settings (model name, load kwargs, ...) never share a cache entry.
+        """
+        return {}
+
+    def _load_file_cached(self, file: Path) -> List[Document]:
+        """load_file with a content-addressed on-disk cache.
+
+        Entries are keyed by the sha256 of the file bytes, the reader class
+        name and a digest of its parse settings, so re-ingesting unchanged
+        documents skips parsing (OCR, pypdf, whisper) entirely. Entries older
+        than PYRECDP_CACHE_TTL seconds are treated as misses.
+        """
+        try:
+            cache_dir = _document_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            settings = repr(sorted(self._parse_settings().items()))
+            settings_digest = hashlib.sha256(settings.encode()).hexdigest()[:16]
+            cache_path = cache_dir / f"{_sha256_file(file)}-{type(self).__name__}-{settings_digest}.pkl"
+        except OSError:
+            return self.load_file(file)
+
+        ttl = os.getenv('PYRECDP_CACHE_TTL')
+        if cache_path.exists():
+            expired = ttl is not None and time.time() - cache_path.stat().st_mtime > float(ttl)
+            if not expired:
+                try:
+                    with open(cache_path, 'rb') as f:
+                        return pickle.load(f)
+                except (OSError, pickle.PickleError):
+                    pass
+
+        docs = self.load_file(file)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.pkl')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(docs, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return docs
+
+    def load_one(self, file: Path) -> List[Document]:
+        """load another file through this instance, reusing its loaded state.
+
+        Pooled readers call this so expensive __init__ work (model and engine
+        loads) is not repeated per file.
+        """
+        self.file = file
+        return self.load()
+
     def load(self) -> List[Document]:
-        docs: List[Document] = self.load_file(self.file)
-        docs: List[Document] = list(filter(lambda d: (d.text.strip() != ""), docs))
-
-        def firstAlphaIsUppercase(word: str) -> bool:
-            i: int = 0
-            while i < len(word):
-                char = doc.text[i]
-                if char.isalpha():
-                    return char.isupper()
-                i += 1
-            return False
+        docs: List[Document] = self._load_file_cached(self.file)
+        if not self.pre_filtered:
+            docs = list(filter(lambda d: (d.text.strip() != ""), docs))
+
+        def first_alpha_is_uppercase(word: str) -> bool:
+            match = _FIRST_ALPHA.search(word)
+            return bool(match) and match.group(0).isupper()
 
         if self.single_text_per_document:
-            text = ''
+            parts = []
             for doc in docs:
-                if firstAlphaIsUppercase(doc.text):
-                    text += f"\n\n {doc.text}"
+                if first_alpha_is_uppercase(doc.text):
+                    parts.append(f"\n\n {doc.text}")
                 else:
-                    text += f" {doc.text}"
+                    parts.append(f" {doc.text}")
 
-            return [Document(text=text, metadata=self.get_metadata())]
+            return [Document(text=''.join(parts), metadata=self.get_metadata())]
         else:
             return docs
 
@@ -82,10 +232,52 @@ class FileBaseReader(DocumentReader, ABC):
         """Load data from the input directory."""
 
 
+def _extract_pdf_page(shm_name: str, page: int, load_kwargs: dict):
+    """extract text of a single pdf page in a worker process.
+
+    The parent places the raw PDF bytes in shared memory once; each worker
+    wraps them in BytesIO and builds its own reader (pypdf objects are not
+    picklable) without re-reading the file from disk.
+    """
+    import io
+    import pypdf
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pdf = pypdf.PdfReader(io.BytesIO(bytes(shm.buf)), **load_kwargs)
+        return page, pdf.pages[page].extract_text()
+    finally:
+        shm.close()
+
+
+# minimum page count before per-page extraction is worth the worker setup cost
+_PDF_PARALLEL_PAGE_THRESHOLD = 4
+
+
+def _detect_pdf_backend() -> str:
+    """pick the PDF text-extraction backend once at import time.
+
+    pypdf tokenizes content streams in pure python; playa does the same work
+    in C and is preferred when installed. pikepdf (libqpdf) is only honored
+    via the PYRECDP_PDF_BACKEND override, since it has no text decoder and
+    our content-stream scrape ignores font cmaps.
+    """
+    backend = os.getenv('PYRECDP_PDF_BACKEND')
+    if backend:
+        return backend
+    if importlib.util.find_spec('playa') is not None:
+        return 'playa'
+    return 'pypdf'
+
+
+_pdf_backend = _detect_pdf_backend()
+
+
 class PDFReader(FileBaseReader):
     """PDF parser."""
     system_requirements = []
     requirements = ['pypdf']
+    cpu_bound = True
 
     def __init__(self, file: Path, single_text_per_document: bool = True, page_separator: str = '\n',
                  **load_kwargs):
@@ -93,7 +285,47 @@ class PDFReader(FileBaseReader):
         self.load_kwargs = load_kwargs
         self.file = file
 
+    def _parse_settings(self) -> dict:
+        return dict(self.load_kwargs)
+
     def load_file(self, file: Path) -> List[Document]:
+        if _pdf_backend != 'pypdf':
+            try:
+                return self._load_file_accelerated(file)
+            except Exception as error:
+                logger.warning(f"{_pdf_backend} backend failed on {file} ({error}), falling back to pypdf")
+        return self._load_file_pypdf(file)
+
+    def _load_file_accelerated(self, file: Path) -> List[Document]:
+        """extract text through a C-accelerated backend."""
+        source = str(file)
+        if _pdf_backend == 'playa':
+            import playa
+            with playa.open(source) as pdf:
+                return [
+                    Document(text=page.extract_text(), metadata={"page_label": str(i + 1), "source": source})
+                    for i, page in enumerate(pdf.pages)
+                ]
+        if _pdf_backend == 'pikepdf':
+            import pikepdf
+            docs = []
+            with pikepdf.open(source) as pdf:
+                for i, page in enumerate(pdf.pages):
+                    # crude Tj/TJ scrape of the content stream; only correct
+                    # for simple encodings, hence opt-in via PYRECDP_PDF_BACKEND
+                    parts = []
+                    for operands, operator in pikepdf.parse_content_stream(page):
+                        if str(operator) == 'Tj':
+                            parts.append(str(operands[0]))
+                        elif str(operator) == 'TJ':
+                            parts.extend(str(op) for op in operands[0]
+                                         if isinstance(op, pikepdf.String))
+                    docs.append(Document(text=''.join(parts),
+                                         metadata={"page_label": str(i + 1), "source": source}))
+            return docs
+        raise ValueError(f"unknown pdf backend '{_pdf_backend}'")
+
+    def _load_file_pypdf(self, file: Path) -> List[Document]:
         import pypdf
         # Create a PDF object
         pdf = pypdf.PdfReader(file, **self.load_kwargs)
@@ -101,13 +333,44 @@ class PDFReader(FileBaseReader):
         # Get the number of pages in the PDF document
         num_pages = len(pdf.pages)
 
-        # Iterate over every page
+        # pypdf's page_labels property re-walks the label tree on every access,
+        # O(N^2) across a per-page loop; materialize it once up front
+        page_labels = list(pdf.page_labels)
+
+        # Page extraction is CPU-bound pure python in pypdf, so fan out to worker
+        # processes for large documents; small ones stay sequential since worker
+        # startup costs more than it saves.
+        max_workers = int(os.getenv('PDF_CONCURRENCY', os.cpu_count() or 1))
+
+        # when this reader already runs inside a pool worker (the directory
+        # loader's process pool), the cores are taken — a nested per-page pool
+        # would stack workers-squared processes plus a shared-memory copy of
+        # the file per PDF, so stay sequential there
+        import multiprocessing
+        in_pool_worker = multiprocessing.parent_process() is not None
+
+        if num_pages > _PDF_PARALLEL_PAGE_THRESHOLD and max_workers > 1 and not in_pool_worker:
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import shared_memory
+            # share the raw bytes once so each worker rebuilds its reader from
+            # memory instead of re-reading the whole file from disk
+            data = Path(file).read_bytes()
+            shm = shared_memory.SharedMemory(create=True, size=len(data))
+            try:
+                shm.buf[:len(data)] = data
+                with ProcessPoolExecutor(max_workers=min(max_workers, num_pages)) as executor:
+                    futures = [executor.submit(_extract_pdf_page, shm.name, page, self.load_kwargs)
+                               for page in range(num_pages)]
+                    pages = sorted(future.result() for future in futures)
+            finally:
+                shm.close()
+                shm.unlink()
+        else:
+            pages = [(page, pdf.pages[page].extract_text()) for page in range(num_pages)]
+
         docs = []
-        for page in range(num_pages):
-            # Extract the text from the page
-            page_text = pdf.pages[page].extract_text()
-            page_label = pdf.page_labels[page]
-            metadata = {"page_label": page_label, "source": str(file)}
+        for page, page_text in pages:
+            metadata = {"page_label": page_labels[page], "source": str(file)}
             docs.append(Document(text=page_text, metadata=metadata))
 
         return docs
@@ -117,6 +380,8 @@ class DocxReader(FileBaseReader):
     """Docx parser."""
     system_requirements = []
     requirements = ['python-docx']
+    cpu_bound = True
+    pre_filtered = True
 
     def __init__(self, file: Path, single_text_per_document: bool = True, page_separator: str = '\n'):
         super().__init__(file, single_text_per_document, page_separator)
@@ -126,18 +391,31 @@ class DocxReader(FileBaseReader):
         import docx
         document = docx.Document(str(file))
 
-        # read in each paragraph in file
-        return [Document(text=p.text, metadata={"source": str(file)}) for p in document.paragraphs]
+        # read in each non-empty paragraph, sharing one metadata dict across
+        # them instead of allocating a copy per paragraph
+        metadata = {"source": str(file)}
+        return [Document(text=p.text, metadata=metadata)
+                for p in document.paragraphs if p.text and p.text.strip()]
 
 
 class ImageReader(FileBaseReader):
     """Image parser.
 
-    Extract text from images using pytesseract.
+    Extract text from images using tesserocr's in-process API when available,
+    falling back to the pytesseract subprocess wrapper.
 
     """
     system_requirements = ['tesseract-ocr']
-    requirements = ['pillow', 'pytesseract']
+    requirements = ['pillow', 'pytesseract', 'tesserocr']
+
+    # one in-process tesseract engine per worker thread; keeping the API
+    # loaded avoids the per-image subprocess spawn and model reload that
+    # pytesseract pays on every call
+    _thread_api = threading.local()
+
+    # set once tesserocr import or engine construction fails, so later images
+    # go straight to the pytesseract fallback instead of retrying a broken init
+    _api_unavailable = False
 
     def __init__(
             self,
@@ -149,27 +427,86 @@ class ImageReader(FileBaseReader):
         super().__init__(file, single_text_per_document, page_separator)
         self._keep_image = keep_image
 
+    def _parse_settings(self) -> dict:
+        return {'keep_image': self._keep_image}
+
+    @classmethod
+    def _get_api(cls):
+        api = getattr(cls._thread_api, 'api', None)
+        if api is None:
+            import tesserocr
+            api = tesserocr.PyTessBaseAPI(lang='eng')
+            cls._thread_api.api = api
+        return api
+
     def load_file(self, file: Path) -> List[Document]:
         """Parse file."""
         from PIL import Image
-        from pytesseract import pytesseract
         # load document image
         image = Image.open(file)
         if image.mode != "RGB":
             image = image.convert("RGB")
 
         # Parse image into text
-        text_str = pytesseract.image_to_string(image)
+        text_str = None
+        if not ImageReader._api_unavailable:
+            try:
+                api = self._get_api()
+            except (ImportError, RuntimeError) as error:
+                # tesserocr may be missing, or import fine but fail engine
+                # construction on a tessdata/version mismatch with the
+                # installed tesseract binary
+                ImageReader._api_unavailable = True
+                logger.warning(f"tesserocr unavailable ({error}), falling back to pytesseract")
+            else:
+                api.SetImage(image)
+                text_str = api.GetUTF8Text()
+        if text_str is None:
+            from pytesseract import pytesseract
+            text_str = pytesseract.image_to_string(image)
 
         return [
             Document(text=text_str, metadata={"source": str(file)})
         ]
 
+    async def load_file_async(self, file: Path) -> List[Document]:
+        """Parse file through aiopytesseract's asyncio subprocess transport."""
+        import aiopytesseract
+        text_str = await aiopytesseract.image_to_string(str(file))
+        return [
+            Document(text=text_str, metadata={"source": str(file)})
+        ]
+
+
+async def _ocr_images_async(image_files: List[Path]) -> List[Document]:
+    """OCR a batch of images concurrently with aiopytesseract.
+
+    Each OCR runs as an asyncio subprocess, so concurrency is not capped by
+    the GIL; the semaphore (OCR_CONCURRENCY, default cpu count) bounds the
+    number of in-flight tesseract processes.
+    """
+    import asyncio
+    import aiopytesseract
+
+    semaphore = asyncio.Semaphore(int(os.getenv('OCR_CONCURRENCY', os.cpu_count() or 1)))
+
+    async def ocr_one(file):
+        async with semaphore:
+            text = await aiopytesseract.image_to_string(str(file))
+            return Document(text=text, metadata={"source": str(file)})
+
+    return list(await asyncio.gather(*[ocr_one(file) for file in image_files]))
+
 
 class AudioReader(FileBaseReader):
     system_requirements = ['ffmpeg']
     requirements = ['openai-whisper']
 
+    # whisper weights take seconds to load even for the small models; cache
+    # them per model name so every reader instance shares one loaded copy
+    _model_cache = {}
+    _model_lock = threading.Lock()
+
     def __init__(
             self,
             file: Path,
@@ -178,11 +515,67 @@ class AudioReader(FileBaseReader):
             model='small',
     ):
         super().__init__(file, single_text_per_document, page_separator)
-        import whisper
-        self.model = whisper.load_model(model)
+        self._model_name = model
+        self.model, self._fp16 = self._get_model(model)
+
+    def _parse_settings(self) -> dict:
+        return {'model': self._model_name}
+
+    @classmethod
+    def _get_model(cls, name):
+        with cls._model_lock:
+            if name not in cls._model_cache:
+                cls._model_cache[name] = cls._load_model(name)
+            return cls._model_cache[name]
+
+    @staticmethod
+    def _load_model(name):
+        """load the fastest transcription backend available for a model name.
+
+        On CUDA the reference whisper model runs in fp16; on CPU the int8
+        CTranslate2 engine from faster-whisper gives several times the
+        throughput of fp32 whisper, which remains the fallback when
+        faster-whisper is not installed. Returns (model, use_fp16).
+        """
+        cuda = False
+        try:
+            import torch
+            cuda = torch.cuda.is_available()
+        except ImportError:
+            pass
+        if cuda:
+            return _whisper().load_model(name, device='cuda'), True
+        try:
+            from faster_whisper import WhisperModel
+            return WhisperModel(name, device='cpu', compute_type='int8'), False
+        except ImportError:
+            return _whisper().load_model(name), False
 
     def transcribe(self, file):
-        return self.model.transcribe(file)
+        if hasattr(self.model, 'decode'):
+            return self.model.transcribe(file, fp16=self._fp16)
+        # faster-whisper yields segments lazily and reports language separately
+        segments, info = self.model.transcribe(file)
+        return {'text': ''.join(segment.text for segment in segments), 'language': info.language}
+
+    def transcribe_batch(self, files: List[str]) -> List[str]:
+        """transcribe many short clips through a single decode call.
+
+        Each clip is padded or trimmed to whisper's 30 second window and the
+        mel spectrograms are stacked so the model decodes the whole batch at
+        once; clips longer than the window should go through transcribe.
+        """
+        if not hasattr(self.model, 'decode'):
+            # faster-whisper has no batch decode entry point
+            return [self.transcribe(file)['text'] for file in files]
+        import torch
+        whisper = _whisper()
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(whisper.load_audio(file)))
+            for file in files
+        ]).to(self.model.device)
+        options = whisper.DecodingOptions(fp16=self._fp16)
+        return [result.text for result in self.model.decode(mels, options)]
 
     def load_file(self, file: Path) -> List[Document]:
         file = str(file)
@@ -192,6 +585,53 @@ class AudioReader(FileBaseReader):
         ]
 
 
+_IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png"}
+
+
+def _batch_ocr_images(image_files: List[Path]) -> List[Document]:
+    """OCR a batch of images through a single tesseract invocation.
+
+    tesseract accepts a text file listing one image per line and emits the
+    concatenated text with form-feed separators, so engine init is paid once
+    per batch instead of once per image.
+    """
+    from pytesseract import pytesseract
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as tmp:
+        tmp.write('\n'.join(str(f) for f in image_files))
+        list_path = tmp.name
+    try:
+        text = pytesseract.image_to_string(list_path)
+    finally:
+        os.unlink(list_path)
+
+    return [
+        Document(text=page_text, metadata={"source": str(file)})
+        for file, page_text in zip(image_files, text.split('\x0c'))
+    ]
+
+
+# per-thread cache of initialized readers, keyed by reader class, so each
+# worker pays reader __init__ once instead of once per file; thread-local
+# storage keeps instances from being shared across pool threads
+_reader_pool = threading.local()
+
+
+def _get_pooled_reader(reader_cls: Type[FileBaseReader], file: Path) -> FileBaseReader:
+    readers = getattr(_reader_pool, 'readers', None)
+    if readers is None:
+        readers = _reader_pool.readers = {}
+    reader = readers.get(reader_cls)
+    if reader is None:
+        reader = readers[reader_cls] = reader_cls(file)
+    return reader
+
+
+def _load_file_in_subprocess(reader_cls: Type[FileBaseReader], file: Path) -> List[Document]:
+    """worker entry for CPU-bound readers; pool workers are reused across
+    tasks, so the pooled reader persists for the worker's lifetime."""
+    return _get_pooled_reader(reader_cls, file).load_one(file)
+
+
 _default_file_readers: Dict[str, Type[FileBaseReader]] = {
     ".pdf": PDFReader,
     ".docx": DocxReader,
@@ -203,6 +643,9 @@ _default_file_readers: Dict[str, Type[FileBaseReader]] = {
     ".flac": AudioReader,
 }
 
+# suffixes whose reader requirements were already installed in this process
+_installed_reader_suffixes: set = set()
+
 
 def read_from_directory(input_dirs: Optional[Union[str, List[str]]] = None,
                         input_files: Optional[list[str]] = None,
@@ -213,44 +656,70 @@ def read_from_directory(input_dirs: Optional[Union[str, List[str]]] = None,
                         max_concurrency: Optional[int] = None,
                         loaders: Optional[dict[str, Callable[[Path], List[Document]]]] = None,
                         required_exts: Optional[List[str]] = None):
-    def read_file(file_to_load, par):
-        try:
-            # use customer loader first if possible
-            if loaders and file_to_load.suffix in loaders:
-                document_loader: Callable = loaders[file_to_load.suffix]
-                assert isinstance(document_loader, Callable)
-                return document_loader(file_to_load)
-
-            # load document with default registered file loader
-            if file_to_load.suffix in _default_file_readers:
-                document_loader_cls: Type[FileBaseReader] = _default_file_readers[file_to_load.suffix]
-                loader = document_loader_cls(file_to_load)
-                return loader.load()
-
-            logger.warning(f"return empty documents, no loader registered for file type '{file_to_load.suffix}'")
-            return []
-        finally:
-            par.update(1)
+    def read_file(file_to_load):
+        # use customer loader first if possible
+        if loaders and file_to_load.suffix in loaders:
+            document_loader: Callable = loaders[file_to_load.suffix]
+            assert isinstance(document_loader, Callable)
+            return document_loader(file_to_load)
+
+        # load document with default registered file loader
+        if file_to_load.suffix in _default_file_readers:
+            document_loader_cls: Type[FileBaseReader] = _default_file_readers[file_to_load.suffix]
+            loader = _get_pooled_reader(document_loader_cls, file_to_load)
+            return loader.load_one(file_to_load)
+
+        logger.warning(f"return empty documents, no loader registered for file type '{file_to_load.suffix}'")
+        return []
+
+    def is_cpu_bound(file_to_load):
+        if loaders and file_to_load.suffix in loaders:
+            return False
+        reader_cls = _default_file_readers.get(file_to_load.suffix)
+        return reader_cls is not None and reader_cls.cpu_bound
+
+    # dedupe while accumulating, keyed on resolved path strings so symlinked or
+    # differently-spelled paths to the same file are caught in a single pass
+    seen_paths = set()
+    files_to_read = []
+
+    def add_file(candidate):
+        key = os.path.realpath(str(candidate))
+        if key in seen_paths:
+            return
+        seen_paths.add(key)
+        files_to_read.append(Path(key))
 
     if input_files:
-        files_to_read = [Path(f) for f in input_files if os.path.isfile(f)]
+        for input_file in input_files:
+            if os.path.isfile(input_file):
+                add_file(input_file)
     else:
         input_dirs = [input_dirs] if isinstance(input_dirs, str) else input_dirs
-        from pyrecdp.core.path_utils import get_files
-        files_to_read = [
-            file_to_read
-            for input_dir in input_dirs
-            for file_to_read in get_files(
-                input_dir,
-                glob=glob,
-                exclude=exclude,
-                exclude_hidden=exclude_hidden,
-                recursive=recursive,
-                required_exts=required_exts,
-            )
-        ]
-
-    files_to_read = list(set(files_to_read))
+        # stream the directory walk instead of materializing it: files flow
+        # straight into the dedupe accumulator while large trees are scanned
+        from pyrecdp.core.path_utils import iter_files
+        for input_dir in input_dirs:
+            for file_to_read in iter_files(
+                    input_dir,
+                    glob=glob,
+                    exclude=exclude,
+                    exclude_hidden=exclude_hidden,
+                    recursive=recursive,
+                    required_exts=required_exts,
+            ):
+                add_file(file_to_read)
+
+    # drop identical copies of the same content (e.g. one file under two paths)
+    seen_fingerprints = set()
+    unique_files = []
+    for file_to_read in files_to_read:
+        fingerprint = _sha256_file(file_to_read)
+        if fingerprint in seen_fingerprints:
+            continue
+        seen_fingerprints.add(fingerprint)
+        unique_files.append(file_to_read)
+    files_to_read = unique_files
 
     if len(files_to_read) == 0:
         return []
@@ -260,25 +729,67 @@ def read_from_directory(input_dirs: Optional[Union[str, List[str]]] = None,
         for input_file in files_to_read:
             file_exts.add(input_file.suffix)
 
-        for file_ext in file_exts:
+        for file_ext in file_exts - _installed_reader_suffixes:
             if file_ext in _default_file_readers:
                 _default_file_readers[file_ext].setup()
+            _installed_reader_suffixes.add(file_ext)
 
     install_reader_requirements()
 
     from tqdm import tqdm
-    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
     pbar = tqdm(total=len(files_to_read))
 
+    # images without a custom loader are grouped into one tesseract invocation,
+    # amortizing its per-subprocess engine init across the whole batch
+    def is_batchable_image(file_to_load):
+        return file_to_load.suffix in _IMAGE_SUFFIXES and not (loaders and file_to_load.suffix in loaders)
+
+    image_files = [f for f in files_to_read if is_batchable_image(f)]
+    other_files = [f for f in files_to_read if not is_batchable_image(f)]
+
+    # pure-python parsers (pypdf, docx) are GIL-bound so a thread pool caps them
+    # at one core; route those through worker processes and keep I/O-bound
+    # readers (subprocess/network backed) on threads
+    cpu_bound_files = [f for f in other_files if is_cpu_bound(f)]
+    io_bound_files = [f for f in other_files if not is_cpu_bound(f)]
+
+    results = []
     try:
-        with ThreadPoolExecutor(max_concurrency) as executor:
-            return [
-                {'text': d.text, 'metadata': d.metadata}
-                for docs in executor.map(lambda f: read_file(f, pbar), files_to_read)
-                for d in docs
-            ]
+        if len(image_files) > 1:
+            try:
+                import importlib.util
+                if importlib.util.find_spec('aiopytesseract') is not None:
+                    import asyncio
+                    image_docs = asyncio.run(_ocr_images_async(image_files))
+                else:
+                    image_docs = _batch_ocr_images(image_files)
+                results.extend({'text': d.text, 'metadata': d.metadata} for d in image_docs)
+                pbar.update(len(image_files))
+            except Exception as error:
+                logger.warning(f"batched OCR failed ({error}), falling back to per-image readers")
+                io_bound_files += image_files
+        else:
+            io_bound_files += image_files
+
+        # process workers are spawned lazily on first submit, so an unused
+        # process pool costs nothing for directories without CPU-bound files
+        with ThreadPoolExecutor(max_concurrency) as thread_executor, \
+                ProcessPoolExecutor(max_workers=max_concurrency or os.cpu_count()) as process_executor:
+            futures = {thread_executor.submit(read_file, f) for f in io_bound_files}
+            futures |= {
+                process_executor.submit(_load_file_in_subprocess, _default_file_readers[f.suffix], f)
+                for f in cpu_bound_files
+            }
+            for future in as_completed(list(futures)):
+                results.extend({'text': d.text, 'metadata': d.metadata} for d in future.result())
+                # drop our reference so the per-file document list is freed as
+                # soon as it is converted, instead of living until the loop ends
+                futures.discard(future)
+                pbar.update(1)
     finally:
         pbar.close()
+    return results
 
 
 def read_from_url(url: str, text_to_markdown: bool,
@@ -317,7 +828,13 @@ def read_from_url(url: str, text_to_markdown: bool,
                 URLs with error responses (400-599).
         """
 
-    from langchain.document_loaders import RecursiveUrlLoader
+    # async loading fetches pages concurrently over one aiohttp session with
+    # keep-alive connection reuse, so default to it unless the caller
+    # explicitly opted out
+    if use_async is None:
+        use_async = True
+
+    RecursiveUrlLoader = _recursive_url_loader()
     if not extractor:
         if text_to_markdown:
             def extractor_with_markdownify(x):
@@ -328,7 +845,13 @@ def read_from_url(url: str, text_to_markdown: bool,
         elif extractor is None:
             def extractor_with_bs4(x):
                 from bs4 import BeautifulSoup
-                return BeautifulSoup(x, "html.parser").text
+                # lxml parses in C, 5-10x faster than the pure-python
+                # html.parser; fall back when it is not installed
+                try:
+                    soup = BeautifulSoup(x, "lxml")
+                except Exception:
+                    soup = BeautifulSoup(x, "html.parser")
+                return soup.get_text(' ', strip=True)
 
             extractor = extractor_with_bs4
 
@@ -351,10 +874,9 @@ def read_from_url(url: str, text_to_markdown: bool,
 def read_from_langchain(loader: str, loader_kwargs: Optional[dict[str, Any]] = None) -> List[dict[str, Any]]:
     """load documents using langchain document loader"""
     from pyrecdp.core.class_utils import new_instance
-    from langchain.document_loaders.base import BaseLoader
     loader_kwargs = loader_kwargs or {}
     loader = new_instance("langchain.document_loaders", loader, **loader_kwargs)
-    assert isinstance(loader, BaseLoader)
+    assert isinstance(loader, _langchain_base_loader())
     return [{'text': doc.page_content, 'metadata': doc.metadata} for doc in loader.load()]
 
 
@@ -370,13 +892,11 @@ def read_youtube_audio(url: Union[str, List[str]], save_dir: Optional[str] = Non
         save_dir = tempfile.mkdtemp()
     docs = []
     try:
-        from langchain.document_loaders.blob_loaders.youtube_audio import YoutubeAudioLoader
-        loader = YoutubeAudioLoader(urls, save_dir)
+        loader = _youtube_audio_loader()(urls, save_dir)
         audio_paths = {}
         for url, blob in zip(urls[::-1], loader.yield_blobs()):
             audio_paths[url] = str(blob.path)
-        import whisper
-        model = whisper.load_model(model_name)
+        model = _whisper().load_model(model_name)
         for url, audio_path in audio_paths.items():
             result = model.transcribe(audio_path)
             docs.append({'text': result['text'], 'metadata': {"source": url, 'language': result['language']}})
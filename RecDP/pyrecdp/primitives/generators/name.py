@@ -24,28 +24,17 @@ class RenameFeatureGenerator(super_class):
 
     def fit_prepare(self, pipeline, children, max_idx):
         pa_schema = pipeline[children[0]].output
-        is_useful = False
-        for pa_field in pa_schema:
-            feature_name = pa_field.name
-            if '.' in feature_name:
-                feature_name = feature_name.replace('.', '__')
-                is_useful = True
-            if ' ' in feature_name:
-                feature_name = feature_name.replace(' ', '_')
-                is_useful = True
-            if '?' in feature_name:
-                feature_name = feature_name.replace('?', '')
-                is_useful = True
-            if ',' in feature_name:
-                feature_name = feature_name.replace(',', '')
-                is_useful = True
-            if is_useful:
-                self.renamed[pa_field.name] = feature_name
+        # single pass: str.replace is a C-level no-op when the character is
+        # absent, so no need for explicit membership checks first
         ret_schema = []
         for pa_field in pa_schema:
-            if pa_field.name in self.renamed:
-                pa_field.name = self.renamed[pa_field.name]
+            feature_name = pa_field.name.replace('.', '__').replace(' ', '_') \
+                .replace('?', '').replace(',', '')
+            if feature_name != pa_field.name:
+                self.renamed[pa_field.name] = feature_name
+                pa_field.name = feature_name
             ret_schema.append(pa_field)
+        is_useful = bool(self.renamed)
 
         if is_useful:
             cur_idx = max_idx + 1
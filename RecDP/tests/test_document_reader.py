@@ -0,0 +1,125 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+pathlib = str(Path(__file__).parent.parent.resolve())
+try:
+    import pyrecdp
+except:
+    print("Not detect system installed pyrecdp, using local one")
+    sys.path.append(pathlib)
+from pyrecdp.primitives.document.reader import FileBaseReader, read_from_directory
+from pyrecdp.primitives.document.schema import Document
+
+
+class CountingReader(FileBaseReader):
+    """stdlib-only reader that counts how often load_file actually runs."""
+    system_requirements = []
+    requirements = []
+
+    def __init__(self, file, tag='default', **kwargs):
+        super().__init__(file, **kwargs)
+        self.tag = tag
+        self.load_file_calls = 0
+
+    def _parse_settings(self):
+        return {'tag': self.tag}
+
+    def load_file(self, file):
+        self.load_file_calls += 1
+        return [Document(text=f"Parsed with {self.tag}", metadata={"source": str(file)})]
+
+
+class TestDocumentParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        os.environ['PYRECDP_CACHE_DIR'] = os.path.join(self._tmp.name, 'cache')
+        self.input_file = Path(self._tmp.name) / 'doc.bin'
+        self.input_file.write_text('some document bytes')
+
+    def tearDown(self):
+        os.environ.pop('PYRECDP_CACHE_DIR', None)
+        os.environ.pop('PYRECDP_CACHE_TTL', None)
+        self._tmp.cleanup()
+
+    def test_cache_hit_skips_parsing(self):
+        reader = CountingReader(self.input_file)
+        first = reader.load()
+        second = reader.load()
+        self.assertEqual(reader.load_file_calls, 1)
+        self.assertEqual([d.text for d in first], [d.text for d in second])
+
+    def test_cache_keyed_on_parse_settings(self):
+        # same bytes, same class, different settings must not share an entry
+        CountingReader(self.input_file, tag='small').load()
+        reader = CountingReader(self.input_file, tag='large')
+        docs = reader.load()
+        self.assertEqual(reader.load_file_calls, 1)
+        self.assertIn('large', docs[0].text)
+
+    def test_cache_ttl_expires_entries(self):
+        reader = CountingReader(self.input_file)
+        reader.load()
+        os.environ['PYRECDP_CACHE_TTL'] = '0'
+        time.sleep(0.01)
+        reader.load()
+        self.assertEqual(reader.load_file_calls, 2)
+
+    def test_changed_content_misses_cache(self):
+        reader = CountingReader(self.input_file)
+        reader.load()
+        self.input_file.write_text('different document bytes')
+        reader.load()
+        self.assertEqual(reader.load_file_calls, 2)
+
+
+class TestReadFromDirectoryDedupe(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_symlinks_and_identical_content_loaded_once(self):
+        (self.base / 'a.txt').write_text('same content')
+        (self.base / 'b.txt').write_text('same content')
+        (self.base / 'c.txt').write_text('different content')
+        os.symlink(self.base / 'a.txt', self.base / 'link.txt')
+
+        loaded = []
+
+        def loader(file):
+            loaded.append(Path(file))
+            return [Document(text=file.read_text(), metadata={"source": str(file)})]
+
+        results = read_from_directory(input_dirs=str(self.base), loaders={'.txt': loader})
+        # link.txt resolves to a.txt and b.txt carries identical bytes, so
+        # only one of {a, b, link} plus c should reach the loader
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(sorted(d['text'] for d in results), ['different content', 'same content'])
+
+    def test_input_files_deduped_by_resolved_path(self):
+        input_file = self.base / 'a.txt'
+        input_file.write_text('content')
+        link = self.base / 'link.txt'
+        os.symlink(input_file, link)
+
+        loaded = []
+
+        def loader(file):
+            loaded.append(Path(file))
+            return []
+
+        read_from_directory(input_files=[str(input_file), str(link), str(input_file)],
+                            loaders={'.txt': loader})
+        self.assertEqual(len(loaded), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+pathlib = str(Path(__file__).parent.parent.resolve())
+try:
+    import pyrecdp
+except:
+    print("Not detect system installed pyrecdp, using local one")
+    sys.path.append(pathlib)
+from pyrecdp.primitives.generators.name import RenameFeatureGenerator
+
+
+class _Field:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestRenameFeatureGenerator(unittest.TestCase):
+
+    def test_only_changed_fields_recorded(self):
+        fields = [_Field('a.b'), _Field('plain'), _Field('c d?'), _Field('x,y')]
+        pipeline = {0: SimpleNamespace(output=fields)}
+        generator = RenameFeatureGenerator()
+        pipeline, cur_idx, max_idx = generator.fit_prepare(pipeline, [0], 0)
+        # 'plain' needs no rename and must not leak into the mapping
+        self.assertEqual(generator.renamed, {'a.b': 'a__b', 'c d?': 'c_d', 'x,y': 'xy'})
+        self.assertEqual([f.name for f in fields], ['a__b', 'plain', 'c_d', 'xy'])
+        self.assertEqual(cur_idx, 1)
+        self.assertEqual(max_idx, 1)
+        self.assertEqual(pipeline[1].op, 'rename')
+        self.assertEqual(pipeline[1].config, generator.renamed)
+
+    def test_clean_schema_passes_through(self):
+        fields = [_Field('plain'), _Field('simple')]
+        pipeline = {0: SimpleNamespace(output=fields)}
+        generator = RenameFeatureGenerator()
+        pipeline, cur_idx, max_idx = generator.fit_prepare(pipeline, [0], 0)
+        self.assertEqual(generator.renamed, {})
+        self.assertEqual(cur_idx, 0)
+        self.assertEqual(max_idx, 0)
+        self.assertNotIn(1, pipeline)
+
+
+if __name__ == '__main__':
+    unittest.main()
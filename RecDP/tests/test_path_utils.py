@@ -0,0 +1,53 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+pathlib = str(Path(__file__).parent.parent.resolve())
+try:
+    import pyrecdp
+except:
+    print("Not detect system installed pyrecdp, using local one")
+    sys.path.append(pathlib)
+from pyrecdp.core.path_utils import get_files, iter_files
+
+
+class TestIterFiles(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        (self.base / 'a.txt').write_text('a')
+        (self.base / 'b.md').write_text('b')
+        (self.base / '.hidden.txt').write_text('h')
+        (self.base / 'sub').mkdir()
+        (self.base / 'sub' / 'c.txt').write_text('c')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_iter_files_matches_get_files(self):
+        for kwargs in (
+                {'recursive': True},
+                {'recursive': False},
+                {'recursive': True, 'required_exts': ['.txt']},
+                {'recursive': True, 'exclude': ['*.md']},
+        ):
+            self.assertEqual(set(iter_files(self.base, **kwargs)),
+                             get_files(self.base, **kwargs),
+                             kwargs)
+
+    def test_iter_files_is_lazy(self):
+        files = iter_files(self.base, recursive=True)
+        self.assertIsInstance(files, types.GeneratorType)
+        first = next(files)
+        self.assertIn(first, get_files(self.base, recursive=True))
+
+    def test_hidden_and_directories_skipped(self):
+        names = {f.name for f in iter_files(self.base, recursive=True)}
+        self.assertEqual(names, {'a.txt', 'b.md', 'c.txt'})
+
+
+if __name__ == '__main__':
+    unittest.main()